@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import typer
 import yaml
+
+try:  # libyaml C loader, much faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from pytessent import PyTessent
-from pytessent.circuit import Circuit, Pin, Pattern
+from pytessent.circuit import Circuit, Pin, Pattern, PinPath
 from tqdm import tqdm
 
 
@@ -28,8 +35,14 @@ class FailBit:
 
 
 def read_backcone_yaml(bc_yaml: Path) -> BackconeConfig:
+    """Read a backcone YAML config, reusing the parsed result until the file changes."""
+    return _read_backcone_yaml_cached(Path(bc_yaml), bc_yaml.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _read_backcone_yaml_cached(bc_yaml: Path, mtime_ns: int) -> BackconeConfig:
     with open(bc_yaml, "rt") as f:
-        bc_fields = yaml.safe_load(f)
+        bc_fields = yaml.load(f, Loader=_YamlLoader)
 
     failbits = [
         FailBit(
@@ -51,53 +64,93 @@ def read_backcone_yaml(bc_yaml: Path) -> BackconeConfig:
     return bccfg
 
 
+# live Tessent sessions keyed by (flat model, pattern file), so interactive
+# re-entry skips the expensive flat model / pattern reload
+_pt_sessions: dict[tuple[str, str], PyTessent] = {}
+
+
 def setup_pytessent(
     flat_model: Path, pat_file: Path, log_file: str | Path | None = None
 ) -> PyTessent:
+    session_key = (str(flat_model), str(pat_file))
+    cached_pt = _pt_sessions.get(session_key)
+    if cached_pt is not None and not cached_pt.closed:
+        return cached_pt
+
     pt = PyTessent(log_file=log_file, replace=True)
-    pt.send_command("set_context pattern -scan")
-    pt.send_command(f"read_flat_model {flat_model}")
-    pt.send_command(f"read_patterns {pat_file}")
+    pt.send_commands(
+        [
+            "set_context pattern -scan",
+            f"read_flat_model {flat_model}",
+            f"read_patterns {pat_file}",
+        ]
+    )
 
+    _pt_sessions[session_key] = pt
     return pt
 
 
-def get_scancell_pin(chain: str, cell: int, c: Circuit) -> Pin:
-    """From a scan chain name and cell index, get the corresponding scan cell pin (using
-    Tessent report_scan_cells)
+def get_scancell_pins(
+    scancells: list[tuple[str, int]], c: Circuit
+) -> dict[tuple[str, int], Pin]:
+    """From (scan chain name, cell index) pairs, get the corresponding scan cell pins
+    (using Tessent report_scan_cell)
+
+    Cells are grouped by chain so only one report_scan_cell command is sent per
+    distinct chain, rather than one per cell.
 
     Arguments:
-        chain: name of scan chain.
-        cell: index of scan cell in scan chain.
-        pt: PyTessent instance.
+        scancells: (chain name, cell index) pairs of scan cells to look up.
+        c: Circuit instance.
 
     Returns:
-        name of scan cell pin.
+        dictionary mapping each (chain, cell) pair to its scan cell Pin.
     """
+    # group cell indices by chain so each chain needs only one report
+    chain_cells: dict[str, list[int]] = defaultdict(list)
+    for chain, cell in scancells:
+        chain_cells[chain].append(cell)
+
+    sc_pins: dict[tuple[str, int], Pin] = {}
+    for chain, cells in chain_cells.items():
+        # query tessent for scan cell report covering all requested cells
+        scr_str = c.pt.send_command(
+            f"report_scan_cell {chain} -range {min(cells)} {max(cells)}"
+        )
 
-    # query tessent for scan cell report
-    scr_str = c.pt.send_command(f"report_scan_cell {chain} -range {cell} {cell}")
+        # index report lines by cell number (first column); only the first 11
+        # fields are ever used, so stop splitting after them
+        scr_fields = {}
+        for scr_line in scr_str.split("\n"):
+            fields = scr_line.split(None, 11)
+            if fields and fields[0].isdigit():
+                scr_fields[int(fields[0])] = fields
 
-    # pull out line with instance
-    scr_line = scr_str.split("\n")[-1]
+        for cell in cells:
+            if cell not in scr_fields:
+                raise ValueError(
+                    f"Cell {cell} not found in scan cell report for chain {chain}"
+                )
 
-    # put together fields to get primitive
-    inst, prim = scr_line.split()[9:11]
+            # put together fields to get primitive
+            inst, prim = scr_fields[cell][9:11]
 
-    # depending on primitive, use string replacement to get pin
-    if prim == '""':
-        sc_pin = f"{inst}/d"
-    else:
-        pin_name = prim.replace("bit", "d").replace(
-            "_inst", ""
-        )  # change "/bit" to "/d", remove "_inst" at the end
-        sc_pin = f"{inst}/{pin_name}"
+            # depending on primitive, use string replacement to get pin
+            if prim == '""':
+                sc_pin = f"{inst}/d"
+            else:
+                pin_name = prim.replace("bit", "d").replace(
+                    "_inst", ""
+                )  # change "/bit" to "/d", remove "_inst" at the end
+                sc_pin = f"{inst}/{pin_name}"
 
-    # remove potential leading slash
-    if sc_pin.startswith("/"):
-        sc_pin = sc_pin[1:]
+            # remove potential leading slash
+            if sc_pin.startswith("/"):
+                sc_pin = sc_pin[1:]
 
-    return c.get_pin(sc_pin)
+            sc_pins[(chain, cell)] = c.get_pin(sc_pin)
+
+    return sc_pins
 
 
 def get_backcone_flop_pins(pin: Pin, c: Circuit) -> list[Pin]:
@@ -109,7 +162,7 @@ def get_backcone_flop_pins(pin: Pin, c: Circuit) -> list[Pin]:
     )
     back_pins = res_str.split()
 
-    return [c.get_pin(p) for p in back_pins]
+    return c.get_pins(back_pins)
 
 
 def get_backcone_pins(pin: Pin, endpoints: list[Pin]) -> set[Pin]:
@@ -127,26 +180,70 @@ def get_backcone_pins(pin: Pin, endpoints: list[Pin]) -> set[Pin]:
     set[Pin]
         Complete set of pins found on backcone.
     """
-    pin_queue = {pin}
-    bc_pins = set()
-    while pin_queue:
-        # get next pin from set
-        cur_pin = pin_queue.pop()
+    endpoint_set = set(endpoints)
+    bc_pins = {pin}
+    frontier = [pin]
+    while frontier:
+        # expand a whole frontier at once: one Tessent round-trip fills the
+        # fanin caches for every pin at this depth, so the trace pays
+        # O(depth) round-trips instead of O(pins)
+        expand = [p for p in frontier if p not in endpoint_set]
+        Pin.prefetch_fanin(expand, pin.pt)
+
+        next_frontier = []
+        for cur_pin in expand:
+            # add unseen fanin of current pin to the next frontier
+            for fanin_pin in cur_pin.fanin:
+                if fanin_pin not in bc_pins:
+                    bc_pins.add(fanin_pin)
+                    next_frontier.append(fanin_pin)
+        frontier = next_frontier
 
-        # skip any previously-seen pins
-        if cur_pin in bc_pins:
-            continue
+    return bc_pins
 
-        bc_pins.add(cur_pin)
 
-        # if endpoint pin is reached, add but don't keep tracing
-        if cur_pin in endpoints:
-            continue
+def analyze_pattern(
+    failpat: Pattern, c: Circuit, paths_from: dict[Pin, list[PinPath]]
+) -> list[PinPath]:
+    """Run X simulation for one failing pattern, recording activated pinpaths.
 
-        # add fanin of current pin to queue
-        pin_queue.update(cur_pin.fanin)
+    Each call owns its pattern's simulation context on the Tessent shell, so
+    patterns must be analyzed one at a time per shell.
 
-    return bc_pins
+    Parameters
+    ----------
+    failpat : Pattern
+        Failing pattern to analyze.
+    c : Circuit
+        Backcone circuit.
+    paths_from : dict[Pin, list[PinPath]]
+        Precomputed pinpaths from each circuit input to the scancell pin.
+
+    Returns
+    -------
+    list[PinPath]
+        Pinpaths activated by the pattern.
+    """
+    failpat.get_circuit_values(c)
+    failpat.create_pattern_sim_context(c)
+
+    # only transitioning inputs need X simulation
+    transition_pins = [
+        ipin
+        for ipin in c.inputs
+        if failpat.pinvalues[ipin][0] != failpat.pinvalues[ipin][1]
+    ]
+    for ipin in tqdm(transition_pins, desc="Input X Simulation"):
+        x_pins, fail_outputs = failpat.simulate_x_at_pin(c, ipin)
+        if fail_outputs:  # fails for some output
+            # fold x_pins into a bitmask once; each path check is then a
+            # single bitwise AND
+            x_mask = PinPath.x_pins_to_mask(x_pins)
+            for pinpath in paths_from[ipin]:
+                if pinpath.is_activated(x_mask):
+                    failpat.add_activated_pinpath(pinpath)
+
+    return failpat.activatedpinpaths
 
 
 def main(
@@ -186,59 +283,76 @@ def main(
     else:
         c = Circuit.empty(bccfg.name, pt)
 
+        # set of defectsite names for O(1) membership tests
+        defect_names = set(bccfg.defectsites)
+
+        # precompute all scancell pins, batching report_scan_cell queries per chain
+        sc_pins = get_scancell_pins(
+            [(failbit.chain, failbit.cell) for failbit in bccfg.failbits], c
+        )
+
         failpatterns = []
         for failbit in bccfg.failbits:
             # get scancell pin, define as output to circuit
-            sc_pin = get_scancell_pin(failbit.chain, failbit.cell, c)
+            sc_pin = sc_pins[(failbit.chain, failbit.cell)]
             c.define_output(sc_pin)
 
             # get pins of flops on backcone, define as inputs to circuit
             bc_flop_pins = get_backcone_flop_pins(sc_pin, c)
-            [c.define_input(p) for p in bc_flop_pins]
+            for p in bc_flop_pins:
+                c.define_input(p)
 
             # get all backcone flops from output pin to input pins, add to circuit
             bc_pins = get_backcone_pins(sc_pin, bc_flop_pins)
-            [c.add_pin(pin) for pin in bc_pins]
+            for pin in bc_pins:
+                c.add_pin(pin)
 
-            # define defect sites
-            [c.define_defectsite(p) for p in c.pins if p.name in bccfg.defectsites]
+            # define defect sites among the newly-added backcone pins
+            for p in bc_pins:
+                if p.name in defect_names:
+                    c.define_defectsite(p)
+            for p in bc_flop_pins:
+                if p.name in defect_names:
+                    c.define_defectsite(p)
 
             failpatterns = [Pattern(p) for p in failbit.failpatterns]
             if analyze_patterns:
+                # path topology is pattern-invariant; enumerate paths to the
+                # scancell pin once per input rather than once per pattern
+                paths_from = {
+                    ipin: c.get_pinpaths(from_pin=ipin, to_pin=sc_pin)
+                    for ipin in c.inputs
+                }
+
                 # cycle through patterns, extract values of each pin in backcone
                 failpaths_per_pattern = {}
                 for failpat in tqdm(failpatterns, desc="Fail Patterns"):
-                    failpaths = []
-                    failpat.get_circuit_values(c)
-                    failpat.create_pattern_sim_context(c)
-                    for ipin in tqdm(c.inputs, desc="Input X Simulation"):
-                        if (
-                            failpat.pinvalues[ipin][0] != failpat.pinvalues[ipin][1]
-                        ):  # transitions
-                            x_pins, fail_outputs = failpat.simulate_x_at_pin(c, ipin)
-                            if fail_outputs:  # fails for some output
-                                [
-                                    failpat.add_activated_pinpath(pinpath)
-                                    for pinpath in c.get_pinpaths(
-                                        from_pin=ipin, to_pin=sc_pin
-                                    )
-                                    if pinpath.is_activated(x_pins)
-                                ]
-                    failpaths_per_pattern[failpat] = failpat.activatedpinpaths
+                    failpaths_per_pattern[failpat] = analyze_pattern(
+                        failpat, c, paths_from
+                    )
+
+                # build the whole report in memory, then write it in one call;
+                # value tuples are interned, so join each distinct one once
+                pv_strs: dict[tuple, str] = {}
+                report_parts = []
+                for pat, failpaths in failpaths_per_pattern.items():
+                    report_parts.append(f"Pattern {pat.index}\n")
+                    for i, failpath in enumerate(failpaths):
+                        report_parts.append(f"  Path {failpath.index} ({i+1}):\n")
+                        for pin in failpath.pins:
+                            pv = pat.pinvalues[pin]
+                            if pv not in pv_strs:
+                                pv_strs[pv] = "".join(pv)
+                            report_parts.append(
+                                f"    {pin.name} {pin.gate.celltype.name} "
+                                f"({pv_strs[pv]}) "
+                                f"{'*' if pin in c.defectsites else ''}\n"
+                            )
+                        report_parts.append("\n")
+                    report_parts.append("\n")
 
                 with open(outdir / "failpaths.txt", "w") as f:
-                    for pat, failpaths in failpaths_per_pattern.items():
-                        f.write(f"Pattern {pat.index}\n")
-                        for i, failpath in enumerate(failpaths):
-                            f.write(f"  Path {failpath.index} ({i+1}):\n")
-                            for pin in failpath.pins:
-                                f.write(
-                                    f"    {pin.name} {pin.gate.celltype.name} "
-                                    f"({''.join(pat.pinvalues[pin])}) "
-                                    f"{'*' if pin in c.defectsites else ''}\n"
-                                )
-                            f.write("\n")
-                        f.write("\n")
+                    f.write("".join(report_parts))
 
     if write_pickle:
         c.to_pickle(outdir / "backcone.pickle", failpatterns)
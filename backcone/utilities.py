@@ -80,11 +80,20 @@ def subcircuit_pytessent_from_verilog(verilog: Path, tessent_log: Path) -> PyTes
     pt.send_command("set_context pattern -scan")
     celllib_dir = Path("/project/voxel_test/tessent_libs/standard_cells/")
 
-    for celllib_file in celllib_dir.glob("*lib"):
-        pt.send_command(f"read_cell_library {celllib_file}")
+    # read all cell libraries in one pipelined batch (sorted for stable order)
+    pt.send_commands(
+        [
+            f"read_cell_library {celllib_file}"
+            for celllib_file in sorted(celllib_dir.glob("*lib"))
+        ]
+    )
 
-    pt.send_command(f"read_verilog {verilog}")
-    pt.send_command("set_design_level top")
-    pt.send_command("set_system_mode analysis")
+    pt.send_commands(
+        [
+            f"read_verilog {verilog}",
+            "set_design_level top",
+            "set_system_mode analysis",
+        ]
+    )
 
     return pt
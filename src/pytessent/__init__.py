@@ -1,4 +1,4 @@
-from .pytessent import PyTessent, get_tessent_exe
+from .pytessent import PyTessent, PyTessentPool, get_tessent_exe, run_dofile
 from . import atpg
 
-__all__ = ["PyTessent", "get_tessent_exe", "atpg"]
+__all__ = ["PyTessent", "PyTessentPool", "get_tessent_exe", "run_dofile", "atpg"]
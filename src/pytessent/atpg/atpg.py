@@ -6,6 +6,32 @@ PatternFormat = Literal["stil", "ascii", "bin", "patdb"]
 FaultType = Literal["stuck", "transition"]
 CoverageEffort = Literal["low", "medium", "high"]
 
+# warm Tessent shells keyed by flat model path, reused across pattern-creation
+# calls to skip the multi-second shell spawn and flat model load
+_shell_pool: dict[str, PyTessent] = {}
+
+
+def _get_shell(
+    flatmodel: Path, log_file: str | Path | None, replace: bool
+) -> PyTessent:
+    """Get a Tessent shell with the given flat model loaded, pooling per model.
+
+    A pooled shell is reset to its setup state between jobs; a new shell is
+    spawned (and pooled) the first time a flat model is used.
+    """
+    key = str(flatmodel)
+    pt = _shell_pool.get(key)
+    if pt is not None and not pt.closed:
+        pt.send_command("reset_state")
+        return pt
+
+    pt = PyTessent(log_file=log_file, replace=replace)
+    pt.send_commands(
+        ["set_context pattern -scan", f"read_flat_model {flatmodel}"]
+    )
+    _shell_pool[key] = pt
+    return pt
+
 
 def create_atpg_patterns(
     flatmodel: Path,
@@ -16,19 +42,17 @@ def create_atpg_patterns(
     coverageeffort: CoverageEffort = "high",
     replace: bool = True,
 ) -> None:
-    with PyTessent(log_file=tessent_log, replace=replace) as pt:
-        pt.send_command("set_context pattern -scan")
-        pt.send_command(f"read_flat_model {flatmodel}")
+    commands = []
+    if faulttype:
+        commands.append(f"set_fault_type {faulttype}")
+    commands += [
+        "add_faults -all",
+        f"create_patterns -coverage_effort {coverageeffort}",
+        f"write_patterns {outfile} -{outformat} {'-replace' if replace else ''} -pattern_sets scan",
+    ]
 
-        if faulttype:
-            pt.send_command(f"set_fault_type {faulttype}")
-
-        pt.send_command("add_faults -all")
-        pt.send_command(f"create_patterns -coverage_effort {coverageeffort}")
-
-        pt.send_command(
-            f"write_patterns {outfile} -{outformat} {'-replace' if replace else ''} -pattern_sets scan"
-        )
+    pt = _get_shell(flatmodel, tessent_log, replace)
+    pt.send_commands(commands)
 
     if not outfile.exists():
         raise FileNotFoundError(f"Did not find pattern file generated at {outfile}")
@@ -43,23 +67,20 @@ def create_random_patterns(
     log_file: str | Path | None = None,
     replace: bool = True,
 ) -> None:
-    with PyTessent(log_file=log_file, replace=replace) as pt:
-        pt.send_command("set_context pattern -scan")
-        pt.send_command(f"read_flat_model {flatmodel}")
-
-        if fault_type:
-            pt.send_command(f"set_fault_type {fault_type}")
-        pt.send_command("add_faults -all")
-        if fault_type == "transition":
-            pt.send_command("set_pattern_type -sequential 2")
-            pt.send_command("set_random_clocks clock")
-        pt.send_command(f"set_random_patterns {num_patterns}")
-
-        pt.send_command("simulate_patterns -source random -store_patterns all")
+    commands = []
+    if fault_type:
+        commands.append(f"set_fault_type {fault_type}")
+    commands.append("add_faults -all")
+    if fault_type == "transition":
+        commands += ["set_pattern_type -sequential 2", "set_random_clocks clock"]
+    commands += [
+        f"set_random_patterns {num_patterns}",
+        "simulate_patterns -source random -store_patterns all",
+        f"write_patterns {output_file} -{output_format} {'-replace' if replace else ''} -pattern_sets scan",
+    ]
 
-        pt.send_command(
-            f"write_patterns {output_file} -{output_format} {'-replace' if replace else ''} -pattern_sets scan"
-        )
+    pt = _get_shell(flatmodel, log_file, replace)
+    pt.send_commands(commands)
 
     if not output_file.exists():
         raise FileNotFoundError(f"Did not find pattern file generated at {output_file}")
@@ -1,11 +1,28 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
+import shelve
+import weakref
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pytessent import PyTessent
     from pytessent.circuit.gate import Gate
 
+# strips Tcl list braces from port query results in a single pass
+_BRACE_TBL = str.maketrans("", "", "{}")
+
+# command templates formatted per gate/module; %-formatting of a precompiled
+# constant beats building the f-string from parts in tight loops
+_MODULE_NAME_CMD = "get_single_attribute_value %s -name module_name"
+_PORTS_CMD = (
+    "puts [get_ports -of_module %s -direction input]; "
+    'puts "---"; '
+    "puts [get_ports -of_module %s -direction output]"
+)
+
 
 class CellType:
     """Represents cell type (Tessent module).
@@ -29,24 +46,87 @@ class CellType:
         Get CellType object from corresponding Gate object.
     """
 
-    _celltypes = {}
+    # per-shell cell type caches; entries are dropped when a shell is collected
+    _celltypes: weakref.WeakKeyDictionary[PyTessent, dict[str, CellType]] = (
+        weakref.WeakKeyDictionary()
+    )
+    # per-shell gate name -> module name maps, filled by prefetch() and from_gate()
+    _gate_modules: weakref.WeakKeyDictionary[PyTessent, dict[str, str]] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    # optional shelve-backed cache persisting module names and port lists
+    # across sessions; see enable_disk_cache
+    _disk_cache: shelve.Shelf | None = None
+
+    @classmethod
+    def enable_disk_cache(
+        cls, cache_key: str, cache_dir: Path | None = None
+    ) -> None:
+        """Persist resolved module names and port lists across sessions.
+
+        Entries live in a shelve file derived from `cache_key` (typically the
+        flat model path), so results are never shared between designs. Once
+        enabled, `from_gate` and the port queries consult the cache before
+        issuing Tessent commands and write back what they resolve.
+        """
+        if cls._disk_cache is not None:
+            return
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "pytessent"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        key_hash = hashlib.blake2b(
+            cache_key.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cls._disk_cache = shelve.open(str(cache_dir / f"celltypes_{key_hash}"))
+        atexit.register(cls._disk_cache.close)
 
     @classmethod
     def get_celltype(cls, name: str, pt: PyTessent) -> CellType:
         """Get CellType object from name of cell."""
-        if name not in cls._celltypes:
-            cls._celltypes[name] = CellType(name, pt)
-        return cls._celltypes[name]
+        celltypes = cls._celltypes.setdefault(pt, {})
+        if name not in celltypes:
+            celltypes[name] = CellType(name, pt)
+        return celltypes[name]
+
+    @classmethod
+    def prefetch(cls, pt: PyTessent, gate_names: list[str]) -> None:
+        """Fetch module names for many gates with a single Tessent command.
+
+        Populates the gate-to-module cache consulted by `from_gate`, replacing one
+        round-trip per gate with one round-trip per batch.
+        """
+        gate_modules = cls._gate_modules.setdefault(pt, {})
+        new_names = [n for n in gate_names if n not in gate_modules]
+        if not new_names:
+            return
+
+        res_str = pt.send_command(
+            "foreach pyt_gate {"
+            + " ".join(new_names)
+            + '} { puts "$pyt_gate '
+            + '[get_single_attribute_value $pyt_gate -name module_name]" }'
+        )
+        for line in res_str.split("\n"):
+            fields = line.split()
+            if len(fields) == 2:
+                gate_modules[fields[0]] = fields[1]
 
     @classmethod
     def from_gate(cls, gate: Gate) -> CellType:
         """Get CellType object from corresponding Gate object."""
-        celltype_name = gate.pt.send_command(
-            f"get_single_attribute_value {gate.name} -name module_name"
-        )
-        if celltype_name not in cls._celltypes:
-            cls._celltypes[celltype_name] = CellType(celltype_name, gate.pt)
-        return cls._celltypes[celltype_name]
+        gate_modules = cls._gate_modules.setdefault(gate.pt, {})
+        if gate.name in gate_modules:
+            celltype_name = gate_modules[gate.name]
+        elif cls._disk_cache is not None and "module:" + gate.name in cls._disk_cache:
+            celltype_name = cls._disk_cache["module:" + gate.name]
+            gate_modules[gate.name] = celltype_name
+        else:
+            celltype_name = gate.pt.send_command(_MODULE_NAME_CMD % gate.name)
+            gate_modules[gate.name] = celltype_name
+            if cls._disk_cache is not None:
+                cls._disk_cache["module:" + gate.name] = celltype_name
+        return cls.get_celltype(celltype_name, gate.pt)
 
     def __init__(self, name: str, pt: PyTessent) -> None:
         """Construct CellType object."""
@@ -67,20 +147,31 @@ class CellType:
         """Get PyTessent instance associated with celltype."""
         return self._pt
 
+    def _load_ports(self) -> None:
+        """Fetch input and output port lists with a single Tessent command."""
+        disk_cache = type(self)._disk_cache
+        if disk_cache is not None and "ports:" + self.name in disk_cache:
+            self._inputs, self._outputs = disk_cache["ports:" + self.name]
+            return
+
+        res_str = self._pt.send_command(_PORTS_CMD % (self.name, self.name))
+        in_str, _, out_str = res_str.partition("---")
+        self._inputs = in_str.translate(_BRACE_TBL).split()
+        self._outputs = out_str.translate(_BRACE_TBL).split()
+
+        if disk_cache is not None:
+            disk_cache["ports:" + self.name] = (self._inputs, self._outputs)
+
     @property
     def inputs(self) -> list[str]:
         """Get list of input ports."""
         if not self._inputs:
-            self._inputs = self._pt.send_command(
-                f"get_ports -of_module {self.name} -direction input"
-            )[1:-1].split()
+            self._load_ports()
         return self._inputs
 
     @property
     def outputs(self) -> list[str]:
         """Get list of output ports."""
         if not self._outputs:
-            self._outputs = self._pt.send_command(
-                f"get_ports -of_module {self.name} -direction output"
-            )[1:-1].split()
+            self._load_ports()
         return self._outputs
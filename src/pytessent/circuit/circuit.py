@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import KeysView, ValuesView
+import gzip
+import hashlib
 import networkx as nx
 import pickle
+import weakref
 
 from pytessent import PyTessent
 from pytessent.circuit.celltype import CellType
@@ -25,11 +29,11 @@ class Circuit:
         Name given to circuit.
     pt : PyTessent
         PyTessent instance for executing Tessent-related tasks.
-    pins : set[Pin]
+    pins : ValuesView[Pin]
         Pins in circuit.
-    gates : set[Gate]
+    gates : ValuesView[Gate]
         Gates in circuit.
-    celltypes : set[CellType]
+    celltypes : ValuesView[CellType]
         CellTypes used in circuit.
     inputs : set[Pin]
         Input pins to circuit.
@@ -61,13 +65,34 @@ class Circuit:
         Define a new empty circuit.
     """
 
-    _circuits = []
+    # weak registry of constructed circuits; entries disappear when the last
+    # strong reference drops, so long sessions cannot leak every circuit (and,
+    # transitively, its pins and gates) forever
+    _circuits: weakref.WeakSet[Circuit] = weakref.WeakSet()
+
+    # directory for the optional on-disk gate-graph cache; see enable_graph_cache
+    _graph_cache_dir: Path | None = None
+
+    @classmethod
+    def enable_graph_cache(cls, cache_dir: Path | None = None) -> None:
+        """Persist built gate graphs to disk across sessions.
+
+        Building the gate graph walks every pin's fanin, which costs Tessent
+        round-trips; once enabled, graphs are pickled under `cache_dir` keyed
+        by a hash of the circuit's pin, input, and output names, so a warm run
+        with the same circuit skips the traversal entirely. A changed circuit
+        produces a different key, so stale entries are never hit.
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "pytessent"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cls._graph_cache_dir = cache_dir
 
     @classmethod
     def empty(cls, name: str, pt: PyTessent) -> Circuit:
         """Define a new empty circuit."""
         c = Circuit(name, pt)
-        cls._circuits.append(c)
+        cls._circuits.add(c)
         return c
 
     def __repr__(self) -> str:
@@ -92,6 +117,11 @@ class Circuit:
         self._gate_graph: nx.DiGraph = nx.DiGraph()
         self._pin_graph: nx.DiGraph = nx.DiGraph()
         self._pinpaths: list[PinPath] = []
+        # optional bound on enumerated path length (reconvergent logic can
+        # make unbounded enumeration exponential)
+        self.max_path_len: int | None = None
+        # memoized get_pinpaths results, keyed by the filter arguments
+        self._pinpath_queries: dict[tuple, list[PinPath]] = {}
 
     @property
     def name(self) -> str:
@@ -104,24 +134,28 @@ class Circuit:
         return self._pt
 
     @property
-    def pins(self) -> set[Pin]:
-        """Get list of Pin objects present in circuit."""
-        return set(self._pins.values())
+    def pins(self) -> ValuesView[Pin]:
+        """Get view of Pin objects present in circuit.
+
+        Dict views are O(1) to build and track the circuit as it grows; callers
+        needing set operations wrap the view in `set()` themselves.
+        """
+        return self._pins.values()
 
     @property
-    def pin_names(self) -> set[str]:
-        """Get list of names of pins present in circuit."""
-        return set(self._pins.keys())
+    def pin_names(self) -> KeysView[str]:
+        """Get view of names of pins present in circuit."""
+        return self._pins.keys()
 
     @property
-    def gates(self) -> set[Gate]:
-        """Get list of Gate objects present in circuit."""
-        return set(self._gates.values())
+    def gates(self) -> ValuesView[Gate]:
+        """Get view of Gate objects present in circuit."""
+        return self._gates.values()
 
     @property
-    def celltypes(self) -> set[CellType]:
-        """Get list of CellType objects used on Gates within circuit."""
-        return set(self._celltypes.values())
+    def celltypes(self) -> ValuesView[CellType]:
+        """Get view of CellType objects used on Gates within circuit."""
+        return self._celltypes.values()
 
     @property
     def inputs(self) -> set[Pin]:
@@ -138,11 +172,39 @@ class Circuit:
         """Get defined defect sites for circuit."""
         return self._defectsites
 
+    def _graph_cache_key(self) -> str:
+        """Hash the circuit's pin/input/output names into a cache key."""
+        h = hashlib.blake2b(digest_size=16)
+        for name in sorted(self._pins):
+            h.update(name.encode("utf-8"))
+        h.update(b"|inputs|")
+        for name in sorted(p.name for p in self._inputs):
+            h.update(name.encode("utf-8"))
+        h.update(b"|outputs|")
+        for name in sorted(p.name for p in self._outputs):
+            h.update(name.encode("utf-8"))
+        return h.hexdigest()
+
     @property
     def gate_graph(self) -> nx.DiGraph:
         """Get networkx graph of circuit."""
         if not self._gate_graph:
-            self._gate_graph = self._to_gate_graph()
+            cache_dir = type(self)._graph_cache_dir
+            cache_file = (
+                cache_dir / f"gate_graph_{self._graph_cache_key()}.pickle"
+                if cache_dir is not None
+                else None
+            )
+            if cache_file is not None and cache_file.exists():
+                with open(cache_file, "rb") as f:
+                    self._gate_graph = pickle.load(f)
+            else:
+                self._gate_graph = self._to_gate_graph()
+                if cache_file is not None:
+                    with open(cache_file, "wb") as f:
+                        pickle.dump(
+                            self._gate_graph, f, protocol=pickle.HIGHEST_PROTOCOL
+                        )
         return self._gate_graph
 
     @property
@@ -154,7 +216,7 @@ class Circuit:
 
     def add_pin(self, pin: Pin, update: bool = True) -> None:
         """Add a pre-existing Pin object to the circuit."""
-        if pin not in self.pins:
+        if pin.name not in self._pins:
             self._pins[pin.name] = pin
             try:
                 if update:  # add gate and celltype
@@ -166,48 +228,63 @@ class Circuit:
 
     def get_pin(self, name: str, update: bool = True) -> Pin:
         """Get Pin object from name of pin, add to circuit pins if new."""
-        if name not in self._pins:
-            self._pins[name] = Pin.get_pin(name, self.pt)
+        pin = self._pins.get(name)
+        if pin is None:
+            pin = self._pins[name] = Pin.get_pin(name, self.pt)
             try:
                 if update:  # add gate and celltype
-                    pin_gate = self._pins[name].gate
+                    pin_gate = pin.gate
                     self._gates[pin_gate.name] = pin_gate
                     self._celltypes[pin_gate.celltype.name] = pin_gate.celltype
             except AttributeError:  # pin is not connected to a gate (e.g. IO pin)
                 pass
-        return self._pins[name]
+        return pin
+
+    def get_pins(self, names: list[str], update: bool = True) -> list[Pin]:
+        """Get Pin objects for a list of pin names, adding any new pins to circuit.
+
+        Already-known names are resolved with a single dict lookup each; only
+        unseen names pay the full `get_pin` path.
+        """
+        known = self._pins
+        return [
+            known[name] if name in known else self.get_pin(name, update)
+            for name in names
+        ]
 
     def get_gate(self, name: str, update: bool = True) -> Gate:
         """Get Gate object from name of gate, add to circuit gates."""
-        if name not in self._gates:
-            self._gates[name] = Gate(name, self.pt)
+        gate = self._gates.get(name)
+        if gate is None:
+            gate = self._gates[name] = Gate(name, self.pt)
             if update:  # add gate and celltype
-                gate_celltype = self._gates[name].celltype
+                gate_celltype = gate.celltype
                 self._celltypes[gate_celltype.name] = gate_celltype
-        return self._gates[name]
+        return gate
 
     def get_celltype(self, name: str) -> CellType:
         """Get CellType object from name of cell type, add to circuit cell types."""
-        if name not in self._celltypes:
-            self._celltypes[name] = CellType(name, self.pt)
-        return self._celltypes[name]
+        celltype = self._celltypes.get(name)
+        if celltype is None:
+            celltype = self._celltypes[name] = CellType(name, self.pt)
+        return celltype
 
     def define_input(self, pin: Pin) -> None:
         """Define a given pin as an input (add to input set)."""
-        if pin not in self.pins:
-            raise KeyError
+        if pin.name not in self._pins:
+            raise KeyError(pin.name)
         self._inputs.add(pin)
 
     def define_output(self, pin: Pin) -> None:
         """Define a given pin as an output (add to output set)."""
-        if pin not in self.pins:
-            raise KeyError
+        if pin.name not in self._pins:
+            raise KeyError(pin.name)
         self._outputs.add(pin)
 
     def define_defectsite(self, pin: Pin) -> None:
         """Define a given pin as a defect site (add to defectsite set)."""
-        if pin not in self.pins:
-            raise KeyError
+        if pin.name not in self._pins:
+            raise KeyError(pin.name)
         self._defectsites.add(pin)
 
     def _to_gate_graph(self) -> nx.DiGraph:
@@ -215,61 +292,76 @@ class Circuit:
         # create empty graph
         G = nx.DiGraph()
 
-        # use pins to add normal (non-io) nodes to graph
-        G.add_nodes_from(
-            [
-                (
-                    pin.gate.name,
-                    {
-                        "celltype": pin.gate.celltype.name,
-                        "inputs": [p.name for p in pin.gate.inputs],
-                        "outputs": [p.name for p in pin.gate.outputs],
-                        "io": None,
-                    },
+        # materialize the pin sets once and reuse throughout
+        inputs = self.inputs
+        outputs = self.outputs
+        non_input = set(self.pins) - inputs
+        internal = non_input - outputs
+
+        # pins overwhelmingly share gates, so derive each gate's attribute
+        # record (celltype name plus port-name lists) once and reuse it for
+        # every pin on that gate instead of rebuilding the lists per pin
+        gate_records: dict[Gate, tuple[str, list[str], list[str]]] = {}
+
+        def _gate_record(gate: Gate) -> tuple[str, list[str], list[str]]:
+            record = gate_records.get(gate)
+            if record is None:
+                record = (
+                    gate.celltype.name,
+                    [p.name for p in gate.inputs],
+                    [p.name for p in gate.outputs],
                 )
-                for pin in self.pins - (self.inputs | self.outputs)
-            ]
-        )
+                gate_records[gate] = record
+            return record
+
+        def _node(node: str, gate: Gate, io: str | None):
+            celltype, gate_inputs, gate_outputs = _gate_record(gate)
+            return (
+                node,
+                {
+                    "celltype": celltype,
+                    "inputs": gate_inputs,
+                    "outputs": gate_outputs,
+                    "io": io,
+                },
+            )
 
-        # use pins to add io nodes to graph
+        # use pins to add normal (non-io) nodes to graph, deduplicated by
+        # gate first so each gate node is materialized and inserted once, not
+        # once per pin on the gate
+        internal_gates: dict[str, Gate] = {}
+        for pin in internal:
+            gate = pin.gate
+            internal_gates.setdefault(gate.name, gate)
         G.add_nodes_from(
-            [
-                (
-                    pin.name,
-                    {
-                        "celltype": pin.gate.celltype.name,
-                        "inputs": [p.name for p in pin.gate.inputs],
-                        "outputs": [p.name for p in pin.gate.outputs],
-                        "io": "INPUT",
-                    },
-                )
-                for pin in self.inputs
-            ]
+            _node(name, gate, None) for name, gate in internal_gates.items()
         )
 
-        G.add_nodes_from(
-            [
-                (
-                    pin.name,
-                    {
-                        "celltype": pin.gate.celltype.name,
-                        "inputs": [p.name for p in pin.gate.inputs],
-                        "outputs": [p.name for p in pin.gate.outputs],
-                        "io": "OUTPUT",
-                    },
-                )
-                for pin in self.outputs
-            ]
-        )
+        # use pins to add io nodes to graph
+        G.add_nodes_from(_node(pin.name, pin.gate, "INPUT") for pin in inputs)
 
-        # add edges
-        for pin in self.pins - self.inputs:
-            if pin.direction == "input":
-                sink = pin.name if pin in self.outputs else pin.gate.name
+        G.add_nodes_from(_node(pin.name, pin.gate, "OUTPUT") for pin in outputs)
 
-                for ipin in pin.fanin:
-                    source = ipin.name if ipin in self.inputs else ipin.gate.name
-                    G.add_edge(source, sink)
+        # add edges in one add_edges_from pass; fanin pins are shared between
+        # sinks, so resolve each pin's node name (io pin name vs. owning gate
+        # name) only once
+        node_name: dict[Pin, str] = {}
+
+        def _edges():
+            for pin in non_input:
+                if pin.direction == "input":
+                    sink = pin.name if pin in outputs else pin.gate.name
+
+                    for ipin in pin.fanin:
+                        source = node_name.get(ipin)
+                        if source is None:
+                            source = (
+                                ipin.name if ipin in inputs else ipin.gate.name
+                            )
+                            node_name[ipin] = source
+                        yield source, sink
+
+        G.add_edges_from(_edges())
 
         return G
 
@@ -278,12 +370,16 @@ class Circuit:
         # create empty graph
         G = nx.DiGraph()
 
+        # materialize the pin set once and reuse
+        pins = set(self.pins)
+
         # use pins to add normal (non-io) nodes to graph
-        G.add_nodes_from(self.pins)
+        G.add_nodes_from(pins)
 
         # add edges
-        for pin in self.pins - self.inputs:
-            [G.add_edge(ipin, pin) for ipin in pin.fanin]
+        G.add_edges_from(
+            (ipin, pin) for pin in pins - self.inputs for ipin in pin.fanin
+        )
 
         return G
 
@@ -337,61 +433,70 @@ class Circuit:
         if not outfile:
             outfile = Path(f"{self.name}_backcone.v")
 
-        verilog_lines = []
-
-        # define module line
-        verilog_lines.append(
-            f"module {self.name}( {' , '.join([p.vname for p in list(self.inputs) + list(self.outputs)])} );"
+        # get all nets; an input pin's net comes from its fanin, so prefetch
+        # any uncached fanin in one Tessent command instead of one per pin
+        Pin.prefetch_fanin(
+            [p for p in self.pins if p.direction == "input"], self.pt
         )
-
-        # define inputs and outputs
-        for opin in self.outputs:
-            verilog_lines.append(f"  output {opin.vname} ;")
-        for ipin in self.inputs:
-            verilog_lines.append(f"  input {ipin.vname} ;")
-
-        verilog_lines.append("")
-
-        # get all nets
         pin2net = {p: p.net for p in self.pins}
 
-        nets = set(pin2net.values())
-        for net in nets:
-            print(net)
-            verilog_lines.append(f"  wire {net} ;")
+        # stream lines straight to the (buffered) file handle instead of
+        # accumulating the whole netlist in a list and joining it
+        with open(outfile, "w") as f:
+            # define module line
+            f.write(
+                f"module {self.name}( {' , '.join([p.vname for p in list(self.inputs) + list(self.outputs)])} );\n"
+            )
 
-        verilog_lines.append("")
+            # define inputs and outputs
+            for opin in self.outputs:
+                f.write(f"  output {opin.vname} ;\n")
+            for ipin in self.inputs:
+                f.write(f"  input {ipin.vname} ;\n")
 
-        # connect subcircuit inputs and outputs to nets
-        for opin in self.outputs:
-            verilog_lines.append(f"  assign {opin.vname} = {pin2net[opin]} ;")
-        for ipin in self.inputs:
-            verilog_lines.append(f"  assign {pin2net[ipin]} = {ipin.vname} ;")
+            f.write("\n")
 
-        verilog_lines.append("")
+            for net in set(pin2net.values()):
+                f.write(f"  wire {net} ;\n")
 
-        # write out gates
-        for gate in self.gates:
-            if (self.inputs & set(gate.outputs)) or (self.outputs & set(gate.inputs)):
-                continue
-            pinstr = ", ".join(
-                [f".{p.leaf} ( {pin2net[p]} )" for p in gate.inputs + gate.outputs]
-            )
-            verilog_lines.append(f"  {gate.celltype.name} {gate.vname} ( {pinstr} );")
+            f.write("\n")
 
-        verilog_lines.append("")
+            # connect subcircuit inputs and outputs to nets
+            for opin in self.outputs:
+                f.write(f"  assign {opin.vname} = {pin2net[opin]} ;\n")
+            for ipin in self.inputs:
+                f.write(f"  assign {pin2net[ipin]} = {ipin.vname} ;\n")
+
+            f.write("\n")
+
+            # write out gates (any() short-circuits on the first shared port,
+            # with no temporary sets per gate)
+            inputs = self._inputs
+            outputs = self._outputs
+            for gate in self.gates:
+                if any(o in inputs for o in gate.outputs) or any(
+                    i in outputs for i in gate.inputs
+                ):
+                    continue
+                pinstr = ", ".join(
+                    [f".{p.leaf} ( {pin2net[p]} )" for p in gate.inputs + gate.outputs]
+                )
+                f.write(f"  {gate.celltype.name} {gate.vname} ( {pinstr} );\n")
 
-        verilog_lines.append("endmodule")
-        with open(outfile, "w") as f:
-            f.write("\n".join(verilog_lines))
+            f.write("\nendmodule")
 
     def _get_all_pinpaths(self) -> list[PinPath]:
         """From Circuit pin graph, get all paths from inputs to outputs."""
+        # one DFS per input: handing networkx all outputs as targets lets it
+        # share the traversal instead of restarting from scratch for every
+        # (input, output) pair
         all_pinpaths: list[PinPath] = []
+        targets = set(self.outputs)
         for ipin in self.inputs:
-            for opin in self.outputs:
-                for path in nx.all_simple_paths(self.pin_graph, ipin, opin):
-                    all_pinpaths.append(PinPath(path, len(all_pinpaths)))
+            for path in nx.all_simple_paths(
+                self.pin_graph, ipin, targets, cutoff=self.max_path_len
+            ):
+                all_pinpaths.append(PinPath(path, len(all_pinpaths)))
 
         return all_pinpaths
 
@@ -423,6 +528,10 @@ class Circuit:
         list[PinPath]
             List of filtered paths
         """
+        # same filters are applied per pattern; answer repeats from the cache
+        query = (from_pin, to_pin, tuple(through_pins) if through_pins else None)
+        if query in self._pinpath_queries:
+            return self._pinpath_queries[query]
 
         # start with all paths
         filter_pinpaths = self.pinpaths
@@ -439,14 +548,17 @@ class Circuit:
                 pinpath for pinpath in filter_pinpaths if pinpath.pins[-1] == to_pin
             ]
 
-        # filter based on to pin
+        # filter based on through pins (subset test against each path's
+        # frozenset of pins, not a list scan per through pin)
         if through_pins:
+            through_set = frozenset(through_pins)
             filter_pinpaths = [
                 pinpath
                 for pinpath in filter_pinpaths
-                if all([t in pinpath.pins for t in through_pins])
+                if through_set <= pinpath._pinset
             ]
 
+        self._pinpath_queries[query] = filter_pinpaths
         return filter_pinpaths
 
     def to_pickle(self, outfile: Path, patterns: list[Pattern] | None = None) -> None:
@@ -470,21 +582,26 @@ class Circuit:
 
         circuit_dict["name"] = self.name
 
-        # store pins
+        # store pins (index lookups go through dicts, not linear list scans;
+        # membership sets are bound once outside the loop)
         pin_list = list(self.pins)
+        pin2idx = {pin: i for i, pin in enumerate(pin_list)}
+        inputs = self._inputs
+        outputs = self._outputs
+        defectsites = self._defectsites
         circuit_dict["pins"] = []
         for pin in pin_list:
             pin_dict = {
                 "name": pin.name,
                 "direction": pin.direction,
-                "input": pin in self.inputs,
-                "output": pin in self.outputs,
-                "defectsite": pin in self.defectsites,
+                "input": pin in inputs,
+                "output": pin in outputs,
+                "defectsite": pin in defectsites,
                 "fanin": [
-                    pin_list.index(fpin) for fpin in pin.fanin if fpin in pin_list
+                    pin2idx[fpin] for fpin in pin.fanin if fpin in pin2idx
                 ],
                 "fanout": [
-                    pin_list.index(fpin) for fpin in pin.fanout if fpin in pin_list
+                    pin2idx[fpin] for fpin in pin.fanout if fpin in pin2idx
                 ],
             }
 
@@ -494,25 +611,27 @@ class Circuit:
         circuit_dict["pinpaths"] = []
         for pinpath in self.pinpaths:
             circuit_dict["pinpaths"].append(
-                [pin_list.index(pin) for pin in pinpath.pins]
+                [pin2idx[pin] for pin in pinpath.pins]
             )
 
-        # store patterns
+        # store patterns (activated-path indices resolve through the reverse
+        # map built above, never a linear scan of the pinpaths list)
         if patterns:
+            pinpath2idx = {pp: i for i, pp in enumerate(self.pinpaths)}
             circuit_dict["patterns"] = {}
             for pattern in patterns:
-                circuit_dict["patterns"][pattern.index] = {}
-                circuit_dict["patterns"][pattern.index]["pins"] = [
-                    pattern.pinvalues[pin] for pin in pin_list
-                ]
-                circuit_dict["patterns"][pattern.index]["activatedpinpaths"] = [
-                    self.pinpaths.index(pinpath)
-                    for pinpath in pattern.activatedpinpaths
-                ]
+                circuit_dict["patterns"][pattern.index] = {
+                    "pins": [pattern.pinvalues[pin] for pin in pin_list],
+                    "activatedpinpaths": [
+                        pinpath2idx[pinpath]
+                        for pinpath in pattern.activatedpinpaths
+                    ],
+                }
 
-        # write to pickle file
-        with open(outfile, "wb") as f:
-            pickle.dump(circuit_dict, f)
+        # write to gzipped pickle file (level 1: most of the size win for
+        # little CPU; the index lists are highly compressible)
+        with gzip.open(outfile, "wb", compresslevel=1) as f:
+            pickle.dump(circuit_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def from_pickle(
@@ -534,7 +653,11 @@ class Circuit:
         tuple[Circuit, list[Pattern]]
             Circuit object and list of Pattern objects
         """
+        # accept both gzipped pickles and older uncompressed ones
         with open(infile, "rb") as f:
+            magic = f.read(2)
+        opener = gzip.open if magic == b"\x1f\x8b" else open
+        with opener(infile, "rb") as f:
             circuit_dict = pickle.load(f)
 
         name = name if name else circuit_dict["name"]
@@ -543,25 +666,19 @@ class Circuit:
 
         c = Circuit(name, pt)
 
-        # initialize pins
-        pin_list = [c.get_pin(pin_dict["name"]) for pin_dict in circuit_dict["pins"]]
-
-        # define inputs, outputs, defectsites
-        [
-            c.define_input(c.get_pin(pin_dict["name"]))
-            for pin_dict in circuit_dict["pins"]
-            if pin_dict["input"]
-        ]
-        [
-            c.define_output(c.get_pin(pin_dict["name"]))
-            for pin_dict in circuit_dict["pins"]
-            if pin_dict["output"]
-        ]
-        [
-            c.define_defectsite(c.get_pin(pin_dict["name"]))
-            for pin_dict in circuit_dict["pins"]
-            if pin_dict["defectsite"]
-        ]
+        # initialize pins and define inputs, outputs, defectsites in a single
+        # pass; mutating the role sets directly skips re-resolving each pin
+        # through get_pin three more times
+        pin_list = []
+        for pin_dict in circuit_dict["pins"]:
+            pin = c.get_pin(pin_dict["name"])
+            pin_list.append(pin)
+            if pin_dict["input"]:
+                c._inputs.add(pin)
+            if pin_dict["output"]:
+                c._outputs.add(pin)
+            if pin_dict["defectsite"]:
+                c._defectsites.add(pin)
 
         # define pinpaths
         pinpath_list = [
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import weakref
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pytessent.circuit.celltype import CellType
@@ -10,6 +12,12 @@ if TYPE_CHECKING:
     from pytessent.circuit.pin import GatePin
 
 
+@lru_cache(maxsize=None)
+def _gate_name_of(pin_name: str) -> str:
+    """Extract the gate name from a pin name, memoized per pin name."""
+    return pin_name[: pin_name.rfind("/")]
+
+
 class Gate:
     """Represents a gate instance within a circuit.
 
@@ -34,25 +42,32 @@ class Gate:
         Get gate object from corresponding Pin object.
     """
 
-    _gates: dict[str, Gate] = {}
+    # per-shell gate caches; entries are dropped when a shell is collected
+    _gates: weakref.WeakKeyDictionary[PyTessent, dict[str, Gate]] = (
+        weakref.WeakKeyDictionary()
+    )
 
     @classmethod
     def get_gate(cls, name: str, pt: PyTessent) -> Gate:
         """Get gate object from name of gate."""
-        if name not in cls._gates:
-            cls._gates[name] = Gate(name, pt)
-        return cls._gates[name]
+        gates = cls._gates.setdefault(pt, {})
+        if name not in gates:
+            gates[name] = Gate(name, pt)
+        return gates[name]
 
     @classmethod
     def from_pin(cls, pin: GatePin) -> Gate:
         """Get gate object from corresponding Pin object."""
-        gatename = "/".join(pin.name.split("/")[:-1])  # extract gate name from pin name
+        gatename = _gate_name_of(pin.name)  # extract gate name from pin name
         gate = cls.get_gate(gatename, pin.pt)
 
-        # add pin as gate input or output
-        if pin.direction == "input" and pin not in gate.inputs:
+        # add pin as gate input or output (set guard keeps the lists deduped
+        # without a linear scan per pin)
+        if pin.direction == "input" and pin not in gate._input_set:
+            gate._input_set.add(pin)
             gate._inputs.append(pin)
-        if pin.direction == "output" and pin not in gate.outputs:
+        if pin.direction == "output" and pin not in gate._output_set:
+            gate._output_set.add(pin)
             gate._outputs.append(pin)
 
         return gate
@@ -72,8 +87,12 @@ class Gate:
         self._name: str = name
         self._pt: PyTessent = pt
         self._celltype: CellType | None = None
+        # (sim generation, report_gate output) for the last report fetched
+        self._report: tuple[int, str] | None = None
         self._inputs: list[GatePin] = []
         self._outputs: list[GatePin] = []
+        self._input_set: set[GatePin] = set()
+        self._output_set: set[GatePin] = set()
 
     @property
     def name(self) -> str:
@@ -90,6 +109,20 @@ class Gate:
         """Get PyTessent instance associated with pin."""
         return self._pt
 
+    def get_report(self, generation: int) -> str:
+        """Get report_gate output for gate, cached per simulation generation.
+
+        All pins on a gate share one report, so sibling `get_pin_value` calls
+        hit the cache instead of re-running the command; a bumped generation
+        (new pattern selected on the shell) invalidates the entry lazily.
+        """
+        if self._report is None or self._report[0] != generation:
+            self._report = (
+                generation,
+                self.pt.send_command(f"report_gate {self.name}"),
+            )
+        return self._report[1]
+
     @property
     def celltype(self) -> CellType:
         """Get CellType object corresponding to gate."""
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Literal, TYPE_CHECKING
 
+from pytessent.circuit.pin import Pin
+
 if TYPE_CHECKING:
     from pytessent.circuit.circuit import Circuit
-    from pytessent.circuit.pin import Pin
     from pytessent.circuit.pinpath import PinPath
 
 
@@ -66,9 +67,10 @@ class Pattern:
             Circuit with pins to check
         """
         c.pt.send_command(f"set_gate_report pattern_index {self.index} -external")
-        for pin in c.pins:
-            if pin not in self._pinvalues:
-                self._pinvalues[pin] = pin.get_pin_value()
+        c.pt._sim_generation += 1  # cached gate reports are now stale
+        # fetch all missing pin values in one batched query
+        new_pins = [pin for pin in c.pins if pin not in self._pinvalues]
+        self._pinvalues.update(Pin.batch_get_pin_values(new_pins, c.pt))
 
     def create_pattern_sim_context(self, c: Circuit, v: int = -1) -> None:
         """Create a simulation context representing the values for a given pattern.
@@ -112,12 +114,14 @@ class Pattern:
         c.pt.send_command(f"add_simulation_forces {{{pin.name}}} -value X")
         c.pt.send_command("simulate_forces")
 
-        # get the values of all pins in circuit
-        sim_results = {}
-        for p in c.pins:
-            sim_results[p] = c.pt.send_command(
-                f"get_simulation_value_list {{{p.name}}}"
-            )
+        # get the values of all pins in circuit with a single query
+        pin_list = list(c.pins)
+        value_str = c.pt.send_command(
+            "get_simulation_value_list [list "
+            + " ".join(f"{{{p.name}}}" for p in pin_list)
+            + "]"
+        )
+        sim_results = dict(zip(pin_list, value_str.split()))
 
         # get results of x simulation: what pins get an x, does any output have a pin
         res = (
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import sys
+import weakref
 from abc import ABC
+from itertools import count
 from typing import TYPE_CHECKING, Literal
 
 from pytessent.circuit.gate import Gate
@@ -13,21 +16,83 @@ from pytessent.circuit.utils import (
 if TYPE_CHECKING:
     from pytessent import PyTessent
 
+# shared parsed value tuples, keyed by the raw gate-report value string; pins
+# overwhelmingly repeat the same few value patterns, so intern them
+_pin_value_cache: dict[str, tuple[Literal["0", "1", "X"], ...]] = {}
+
+# Tcl-side memoization of immutable graph structure: fanin/fanout of a pin
+# never change during analysis, so repeat queries become in-process Tcl hash
+# lookups instead of design-database queries
+_TCL_CACHE_PRELUDE = (
+    "namespace eval pyt {}; "
+    "proc pyt::fanin {p} { variable fi; "
+    "if {![info exists fi($p)]} { "
+    "set fi($p) [get_name_list [get_fanin $p]] }; "
+    "return $fi($p) }; "
+    "proc pyt::fanout {p} { variable fo; "
+    "if {![info exists fo($p)]} { set fo($p) [get_name_list "
+    "[filter_collection [get_fanout $p] {object_type != net}]] }; "
+    "return $fo($p) }"
+)
+
+# shells that already have the pyt:: cache procs installed
+_tcl_cache_shells: weakref.WeakSet = weakref.WeakSet()
+
+
+def _ensure_tcl_cache(pt: PyTessent) -> None:
+    """Install the pyt:: cache procs on a shell the first time it is used."""
+    if pt not in _tcl_cache_shells:
+        pt.send_command(_TCL_CACHE_PRELUDE)
+        _tcl_cache_shells.add(pt)
+
+
+# resolves existence, kind (design pin vs. primary port), and direction of a
+# name in one shell round-trip; catch swallows the probe errors so the reply
+# is always a single "kind direction" line
+_PROBE_CMD = (
+    "if {![catch {get_pin {%s}}]} {"
+    ' puts "pin [get_single_attribute_value {%s} -name direction]"'
+    " } elseif {![catch {get_port {%s}}]} {"
+    ' puts "port [get_single_attribute_value {%s} -name direction]"'
+    " } else { puts {none none} }"
+)
+
+
+def _parse_pin_value(
+    pinname: str, gate_rpt_str: str
+) -> tuple[Literal["0", "1", "X"], ...]:
+    """Extract the value tuple for a leaf pin name from a gate report string."""
+    gate_rpt_fields = gate_rpt_str.split()
+    try:
+        value_str = gate_rpt_fields[gate_rpt_fields.index(pinname) + 2]
+    except ValueError:
+        raise ValueError(
+            f'Could not find pin {pinname} in gate report "{gate_rpt_str}"'
+        )
+
+    if value_str not in _pin_value_cache:
+        _pin_value_cache[value_str] = tuple(
+            [v[0] for v in value_str[1:-1].split("-") if v.isnumeric()]  # type: ignore
+        )
+    return _pin_value_cache[value_str]
+
 
 class Pin(ABC):
     """Represents pin object.
 
     Attributes
     ----------
+    id : int
+        Dense integer id of pin, assigned in creation order.
     name : str
         Name of pin.
     pt : PyTessent
         PyTessent instance for executing Tessent-related tasks.
     direction : str
         Is pin "input" or "output" of gate?
-    fanin : set[Pin]
+    fanin : tuple[Pin, ...]
         Other pins on fanin of given pin.
-    fanout : set[Pin]
+    fanout : tuple[Pin, ...]
         Other pins on fanout of given pin.
     gate : Gate
         Gate that pin is a part of.
@@ -45,21 +110,29 @@ class Pin(ABC):
         Get pin object from name of pin.
     """
 
+    # fixed attribute layout: millions of pins are created on large designs,
+    # and dropping the per-instance __dict__ roughly halves their footprint
+    __slots__ = ("_id", "_name", "_pt", "_direction")
+
     _pins: dict[str, Pin] = {}
+    _next_id = count()
     net_itr_limit = 3
 
     @classmethod
     def get_pin(cls, name: str, pt: PyTessent) -> Pin:
         """Get pin object from name of pin."""
         if name not in cls._pins:  # get pin if it has already been created
-            if cls.verify_pin(name, pt):  # otherwise, create
-                cls._pins[name] = GatePin(name, pt)
-            elif cls.verify_primarypin(name, pt):
-                pin_direction = cls.pin_direction(name, pt)
+            # one round-trip answers existence, kind, and direction together,
+            # instead of separate verify_pin/verify_primarypin/pin_direction
+            # commands per pin
+            kind, pin_direction = cls.probe_pin(name, pt)
+            if kind == "pin":
+                cls._pins[name] = GatePin(name, pt, pin_direction)
+            elif kind == "port":
                 if pin_direction == "input":
-                    cls._pins[name] = PrimaryInput(name, pt)
+                    cls._pins[name] = PrimaryInput(name, pt, pin_direction)
                 elif pin_direction == "output":
-                    cls._pins[name] = PrimaryOutput(name, pt)
+                    cls._pins[name] = PrimaryOutput(name, pt, pin_direction)
             else:
                 raise CircuitElementNotFoundException(
                     f"Pin {name} not found in design."
@@ -67,6 +140,148 @@ class Pin(ABC):
 
         return cls._pins[name]
 
+    @staticmethod
+    def probe_pin(name: str, pt: PyTessent) -> tuple[str, str]:
+        """Resolve kind and direction of a pin name in one Tessent command.
+
+        Returns a `(kind, direction)` pair, where kind is `"pin"` for a design
+        pin, `"port"` for a primary input/output, or `"none"` if the name does
+        not exist in the design.
+        """
+        res = pt.send_command(_PROBE_CMD % (name, name, name, name))
+        fields = res.split()
+        if len(fields) != 2:
+            raise ValueError(f'Unexpected pin probe result: "{res}"')
+        return fields[0], fields[1]
+
+    @classmethod
+    def batch_get_pin_values(
+        cls, pins: list[Pin], pt: PyTessent
+    ) -> dict[Pin, tuple[Literal["0", "1", "X"], ...]]:
+        """Get gate-report values for many pins with a single Tessent command.
+
+        Equivalent to calling `get_pin_value` on each pin, but all gate reports
+        come back in one reply, so the shell round-trip is paid once per batch
+        rather than once per pin.
+        """
+        if not pins:
+            return {}
+
+        res_str = pt.send_command(
+            "foreach pyt_pin {"
+            + " ".join(p.name for p in pins)
+            + '} { puts "===$pyt_pin"; puts [report_gate $pyt_pin] }'
+        )
+
+        # split the reply back into one gate report per pin at the sentinels
+        reports: dict[str, str] = {}
+        current: str | None = None
+        lines: list[str] = []
+        for line in res_str.split("\n"):
+            if line.startswith("==="):
+                if current is not None:
+                    reports[current] = "\n".join(lines)
+                current = line[3:].strip()
+                lines = []
+            else:
+                lines.append(line)
+        if current is not None:
+            reports[current] = "\n".join(lines)
+
+        return {
+            p: _parse_pin_value(p.leaf, reports[p.name])
+            for p in pins
+        }
+
+    @classmethod
+    def prefetch_neighbors(cls, pins: list[Pin], pt: PyTessent) -> None:
+        """Fetch fanin and fanout for many pins with a single Tessent command.
+
+        Fills both neighbor caches for the whole batch, so a breadth-first
+        traversal pays one round-trip per frontier instead of one (or, for
+        fanout with its per-pin object-type filter, several) per pin. Pins
+        with both caches already filled are skipped.
+        """
+        new_pins = [
+            p
+            for p in pins
+            if (not isinstance(p, PrimaryInput) and p._fanin is None)
+            or (not isinstance(p, PrimaryOutput) and p._fanout is None)
+        ]
+        if not new_pins:
+            return
+
+        res_str = pt.send_command(
+            "foreach pyt_pin {"
+            + " ".join(p.name for p in new_pins)
+            + "} { "
+            + 'puts "FI\t$pyt_pin\t[get_name_list [get_fanin $pyt_pin]]"; '
+            + "foreach pyt_fo [get_name_list [get_fanout $pyt_pin]] { "
+            + 'puts "FO\t$pyt_pin\t$pyt_fo\t'
+            + '[get_attribute_value_list $pyt_fo -name object_type]" } }'
+        )
+        fanin_strs: dict[str, str] = {}
+        fanout_strs: dict[str, list[str]] = {p.name: [] for p in new_pins}
+        for line in res_str.split("\n"):
+            fields = line.split("\t")
+            if fields[0] == "FI" and len(fields) == 3:
+                fanin_strs[fields[1]] = fields[2]
+            elif fields[0] == "FO" and len(fields) == 4:
+                if fields[3].strip() != "net":
+                    fanout_strs[fields[1]].append(fields[2])
+
+        for p in new_pins:
+            if not isinstance(p, PrimaryInput) and p._fanin is None:
+                if p.name in fanin_strs:
+                    p._fanin = tuple(
+                        dict.fromkeys(
+                            cls.get_pin(n, pt)
+                            for n in parse_name_list(fanin_strs[p.name])
+                        )
+                    )
+            if not isinstance(p, PrimaryOutput) and p._fanout is None:
+                p._fanout = tuple(
+                    dict.fromkeys(
+                        cls.get_pin(n, pt)
+                        for n in parse_name_list(" ".join(fanout_strs[p.name]))
+                    )
+                )
+
+    @classmethod
+    def prefetch_fanin(cls, pins: list[Pin], pt: PyTessent) -> None:
+        """Fetch fanin for many pins with a single Tessent command.
+
+        Fills each pin's fanin cache, replacing one get_fanin round-trip per pin
+        with one round-trip per batch. Pins whose fanin is already cached (and
+        primary inputs, which have none) are skipped.
+        """
+        new_pins = [
+            p for p in pins if not isinstance(p, PrimaryInput) and p._fanin is None
+        ]
+        if not new_pins:
+            return
+
+        _ensure_tcl_cache(pt)
+        res_str = pt.send_command(
+            "foreach pyt_pin {"
+            + " ".join(p.name for p in new_pins)
+            + '} { puts "$pyt_pin\\t[pyt::fanin $pyt_pin]" }'
+        )
+        fanin_strs = {}
+        for line in res_str.split("\n"):
+            pin_name, sep, fanin_str = line.partition("\t")
+            if sep:
+                fanin_strs[pin_name] = fanin_str
+
+        for p in new_pins:
+            if p.name in fanin_strs:
+                p._fanin = tuple(
+                    dict.fromkeys(
+                        cls.get_pin(n, pt)
+                        for n in parse_name_list(fanin_strs[p.name])
+                    )
+                )
+
     @staticmethod
     def pin_direction(name: str, pt: PyTessent) -> str:
         """Get direction of pin."""
@@ -77,11 +292,23 @@ class Pin(ABC):
             raise ValueError(f"Unknown pin direction: {pin_direction}")
         return pin_direction
 
-    def __init__(self, name: str, pt: PyTessent) -> None:
-        """Construct Pin object."""
-        self._name: str = name
+    def __init__(
+        self, name: str, pt: PyTessent, direction: str | None = None
+    ) -> None:
+        """Construct Pin object.
+
+        Passing a `direction` already resolved by the caller (`probe_pin`)
+        skips the per-pin direction query.
+        """
+        self._id: int = next(Pin._next_id)
+        # intern the name (it doubles as the _pins key, so interned strings
+        # make those probes pointer comparisons) and the direction (two
+        # distinct values shared by every pin instead of per-pin copies)
+        self._name: str = sys.intern(name)
         self._pt: PyTessent = pt
-        self._direction: str = self.pin_direction(name, pt)
+        if direction is None:
+            direction = self.pin_direction(name, pt)
+        self._direction: str = sys.intern(direction)
 
     @staticmethod
     def verify_pin(pin: str, pt: PyTessent) -> bool:
@@ -93,6 +320,11 @@ class Pin(ABC):
         """Verify that primary input/output pin exists in the design."""
         return "Error" not in pt.send_command(f"get_port {pin}")
 
+    @property
+    def id(self) -> int:
+        """Get dense integer id of pin (assigned in creation order)."""
+        return self._id
+
     @property
     def name(self) -> str:
         """Get name of pin."""
@@ -124,43 +356,49 @@ class Pin(ABC):
         if self.direction == "output":
             return self.netname
         elif self.direction == "input":
-            return self.fanin.pop().netname
+            return self.fanin[0].netname
         else:
             raise ValueError(f"Unknown pin direction: {self.direction}")
 
     @property
-    def fanin(self) -> set[Pin]:
-        """Get fanin Pin objects from pin."""
-        if not self._fanin:
-            name_list_str = self.pt.send_command(
-                f"get_name_list [get_fanin {self.name}]"
-            )
+    def fanin(self) -> tuple[Pin, ...]:
+        """Get fanin Pin objects from pin.
+
+        Fetched from Tessent on first access and cached; a `None` sentinel
+        marks the unfetched state so pins with genuinely empty fanin do not
+        re-query on every access.
+        """
+        if self._fanin is None:
+            _ensure_tcl_cache(self.pt)
+            name_list_str = self.pt.send_command(f"pyt::fanin {self.name}")
             fanin_pins = parse_name_list(name_list_str)
-            self._fanin = set([self.get_pin(p, self.pt) for p in fanin_pins])
-            if self.direction == "input" and len(self.fanin) > 1:
+            fanin = tuple(
+                dict.fromkeys(self.get_pin(p, self.pt) for p in fanin_pins)
+            )
+            if self._direction == "input" and len(fanin) > 1:
                 raise ValueError(
-                    f"Input pin {self.name} has multiple fanin pins: {self.fanin}"
+                    f"Input pin {self.name} has multiple fanin pins: {fanin}"
                 )
+            self._fanin = fanin
 
         return self._fanin
 
     @property
-    def fanout(self) -> set[Pin]:
-        """Get fanout Pin objects from pin."""
-        if not self._fanout:
-            name_list_str = self.pt.send_command(
-                f"get_name_list [get_fanout {self.name}]"
-            )
+    def fanout(self) -> tuple[Pin, ...]:
+        """Get fanout Pin objects from pin.
+
+        Fetched from Tessent on first access and cached, with the same `None`
+        unfetched sentinel as `fanin`.
+        """
+        if self._fanout is None:
+            # nets are filtered out inside Tessent (one round-trip instead of
+            # one object-type query per candidate pin), and the answer is
+            # memoized shell-side by the pyt:: cache
+            _ensure_tcl_cache(self.pt)
+            name_list_str = self.pt.send_command(f"pyt::fanout {self.name}")
             fanout_pins = parse_name_list(name_list_str)
-            self._fanout = set(
-                [
-                    self.get_pin(p, self.pt)
-                    for p in fanout_pins
-                    if not self.pt.send_command(
-                        f"get_attribute_value_list {p} -name object_type"
-                    )
-                    == "net"
-                ]
+            self._fanout = tuple(
+                dict.fromkeys(self.get_pin(p, self.pt) for p in fanout_pins)
             )
 
         return self._fanout
@@ -169,20 +407,28 @@ class Pin(ABC):
 class GatePin(Pin):
     """Represents pin on a gate instance."""
 
+    __slots__ = ("_fanin", "_fanout", "_gate", "_leaf")
+
     def __repr__(self) -> str:
         return f"GatePin({self.name})"
 
-    def __init__(self, name: str, pt: PyTessent) -> None:
-        if not self.verify_pin(name, pt):
+    def __init__(
+        self, name: str, pt: PyTessent, direction: str | None = None
+    ) -> None:
+        # a caller-resolved direction implies the probe already verified the
+        # pin exists; only direct construction pays the verification query
+        if direction is None and not self.verify_pin(name, pt):
             raise CircuitElementNotFoundException(f"Pin {name} not found in design.")
 
-        super().__init__(name, pt)
+        super().__init__(name, pt, direction)
 
-        # leave fanin/fanout blank, will fill when called
-        self._fanin: set[Pin] = set()
-        self._fanout: set[Pin] = set()
+        # leave fanin/fanout unfetched (None), will fill when called
+        self._fanin: tuple[Pin, ...] | None = None
+        self._fanout: tuple[Pin, ...] | None = None
 
-        self._gate: Gate = Gate.from_pin(self)
+        # gate resolution costs a shell round-trip for unseen gates, so it is
+        # deferred to the first gate access; connectivity-only walks skip it
+        self._gate: Gate | None = None
         self._leaf = name.split("/")[-1]
 
     @property
@@ -192,7 +438,9 @@ class GatePin(Pin):
 
     @property
     def gate(self) -> Gate:
-        """Get Gate object that pin is on."""
+        """Get Gate object that pin is on (resolved lazily on first access)."""
+        if self._gate is None:
+            self._gate = Gate.from_pin(self)
         return self._gate
 
     def get_pin_value(self) -> tuple[Literal["0", "1", "X"], ...]:
@@ -208,36 +456,29 @@ class GatePin(Pin):
         ValueError
             If pin name could not be found in gate report
         """
-        gate_rpt_str = self._pt.send_command(f"report_gate {self.name}")
-        pinname = self.name.split("/")[-1]
-        gate_rpt_fields = gate_rpt_str.split()
-        try:
-            value_str = gate_rpt_fields[gate_rpt_fields.index(pinname) + 2]
-        except ValueError:
-            raise ValueError(
-                f'Could not find pin {pinname} in gate report "{gate_rpt_str}"'
-            )
-
-        return tuple(
-            [v[0] for v in value_str[1:-1].split("-") if v.isnumeric()]  # type: ignore
-        )
+        gate_rpt_str = self.gate.get_report(self._pt._sim_generation)
+        return _parse_pin_value(self._leaf, gate_rpt_str)
 
 
 class PrimaryInput(Pin):
     """Represents a primary input pin."""
 
+    __slots__ = ("_fanout",)
+
     def __repr__(self) -> str:
         return f"PrimaryInput({self.name})"
 
-    def __init__(self, name: str, pt: PyTessent) -> None:
-        super().__init__(name, pt)
+    def __init__(
+        self, name: str, pt: PyTessent, direction: str | None = None
+    ) -> None:
+        super().__init__(name, pt, direction)
 
-        # leave fanin/fanout blank, will fill when called
-        self._fanout: set[Pin] = set()
+        # leave fanout unfetched (None), will fill when called
+        self._fanout: tuple[Pin, ...] | None = None
 
     @property
-    def fanin(self) -> set[Pin]:
-        return set([])
+    def fanin(self) -> tuple[Pin, ...]:
+        return ()
 
     @property
     def net(self) -> str:
@@ -248,19 +489,23 @@ class PrimaryInput(Pin):
 class PrimaryOutput(Pin):
     """Represents a primary ourtput pin."""
 
+    __slots__ = ("_fanin",)
+
     def __repr__(self) -> str:
         return f"PrimaryOutput({self.name})"
 
-    def __init__(self, name: str, pt: PyTessent) -> None:
-        # leave fanin/fanout blank, will fill when called
-        self._fanin: set[Pin] = set()
-        super().__init__(name, pt)
+    def __init__(
+        self, name: str, pt: PyTessent, direction: str | None = None
+    ) -> None:
+        # leave fanin unfetched (None), will fill when called
+        self._fanin: tuple[Pin, ...] | None = None
+        super().__init__(name, pt, direction)
 
     @property
-    def fanout(self) -> set[Pin]:
-        return set([])
+    def fanout(self) -> tuple[Pin, ...]:
+        return ()
 
     @property
     def net(self) -> str:
         """Get net name of pin."""
-        return self.fanin.pop().netname
+        return self.fanin[0].netname
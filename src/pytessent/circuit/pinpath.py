@@ -22,12 +22,22 @@ class PinPath:
         Was path activated for set of pins receiving X?
     """
 
+    __slots__ = ("_pins", "_pinset", "_mask", "_index", "_pdf_str")
+
     def __repr__(self) -> str:
         return f"PinPath({'->'.join([p.name for p in self.pins])})"
 
     def __init__(self, pins: list[Pin], index: int | None = None) -> None:
         self._pins: list[Pin] = pins
+        self._pinset: frozenset[Pin] = frozenset(pins)
+        # bitmask over the dense pin ids; activation against a mask is one
+        # bitwise AND instead of per-pin hashing
+        mask = 0
+        for p in pins:
+            mask |= 1 << p.id
+        self._mask: int = mask
         self._index: int | None = index
+        self._pdf_str: str | None = None
 
     @property
     def pins(self) -> list[Pin]:
@@ -39,8 +49,24 @@ class PinPath:
             raise ValueError("Index has not been set")
         return self._index
 
-    def is_activated(self, x_pins: set[Pin]) -> bool:
-        return set(self.pins) <= x_pins
+    @staticmethod
+    def x_pins_to_mask(x_pins: set[Pin]) -> int:
+        """Fold a set of X-receiving pins into the mask form of is_activated."""
+        mask = 0
+        for p in x_pins:
+            mask |= 1 << p.id
+        return mask
+
+    def is_activated(self, x_pins: set[Pin] | int) -> bool:
+        """Was path activated for set of pins receiving X?
+
+        Accepts either the set of pins or an integer mask from
+        `x_pins_to_mask`; callers checking many paths against the same set
+        should build the mask once and pass that.
+        """
+        if isinstance(x_pins, int):
+            return not (self._mask & ~x_pins)
+        return self._pinset <= x_pins
 
     def get_pdf_string(self) -> str:
         """Get string for Tessent PDF fault definition for path.
@@ -50,9 +76,14 @@ class PinPath:
         str
             String to write to PDF fault site file.
         """
-        pdf_str = f'PATH "path_{self.index}" = \n'
-        for pin in self.pins:
-            pdf_str += f"  PIN {pin.name} ;\n"
-        pdf_str += "END ;"
-
-        return pdf_str
+        # built with one join (repeated += reallocates quadratically) and
+        # memoized — paths are immutable, so the string never changes
+        if self._pdf_str is None:
+            self._pdf_str = "".join(
+                [
+                    f'PATH "path_{self.index}" = \n',
+                    *(f"  PIN {pin.name} ;\n" for pin in self.pins),
+                    "END ;",
+                ]
+            )
+        return self._pdf_str
@@ -1,23 +1,32 @@
 import re
+from functools import lru_cache
+
+# scrubbing table and tokenizer regex built once at import; parse_name_list is
+# called on every get_name_list reply, so per-call compiles and chained
+# replace passes add up
+_STRIP_TBL = str.maketrans("", "", " \\{}")
+_TOKEN_RE = re.compile(r"{[^}]+}|[^{\s]+")
+
+# characters that force a verilog escaped identifier
+_ESCAPE_RE = re.compile(r"[][(){}$]")
 
 
 class CircuitElementNotFoundException(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
 def verilog_name(name: str) -> str:
+    """Get the verilog identifier for a design name, memoized per name."""
     name = name.replace("/", "__")
-    if any([c in name for c in "[](){}$"]):
+    if _ESCAPE_RE.search(name):
         name = f"\\{name}"
     return name
 
 
 def parse_name(name_str: str) -> str:
-    return name_str.replace(" ", "").replace("\\", "").replace("{", "").replace("}", "")
+    return name_str.translate(_STRIP_TBL)
 
 
 def parse_name_list(name_list: str) -> list[str]:
-    return [
-        p.replace(" ", "").replace("\\", "").replace("{", "").replace("}", "")
-        for p in re.findall(r"{[^}]+}|[^{\s]+", name_list)
-    ]
+    return [p.translate(_STRIP_TBL) for p in _TOKEN_RE.findall(name_list)]
@@ -1,20 +1,56 @@
 from __future__ import annotations
 
+import os
 import re
 import weakref
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
 from shutil import which
-from typing import Awaitable, Literal, overload
+from typing import TYPE_CHECKING, Awaitable, Literal, overload
 
-import pexpect
+if TYPE_CHECKING:
+    import pexpect
 
 _TESSENT_ENCODING = "utf-8"
 
 
+def _strip_backspaces(data: bytes) -> bytes:
+    """Drop the "weird backspace characters" (char followed by BS) from data.
+
+    A single linear pass over the raw bytes, skipped entirely when no
+    backspace is present (the common case); much cheaper than a regex
+    substitution over large command outputs.
+    """
+    if b"\x08" not in data:
+        return data
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        if i + 1 < n and data[i + 1] == 0x08:
+            i += 2
+        else:
+            out.append(data[i])
+            i += 1
+    return bytes(out)
+
+
 class TessentCommandError(Exception):
     pass
 
 
+@lru_cache(maxsize=None)
+def _which_tessent(path_env: str) -> str | None:
+    """Locate tessent on $PATH once per PATH value.
+
+    Spawning many shells re-resolved the executable with a directory-by-
+    directory stat scan each time; caching on the PATH string keeps the
+    result fresh if the environment changes.
+    """
+    return which("tessent")
+
+
 def get_tessent_exe(specified_exe: str | Path | None = None) -> str:
     """Get the path to the Tessent executable to use.
 
@@ -24,7 +60,7 @@ def get_tessent_exe(specified_exe: str | Path | None = None) -> str:
     """
     if not specified_exe:
         # Check for tessent exe on $PATH
-        if not which("tessent"):
+        if not _which_tessent(os.environ.get("PATH", "")):
             raise FileNotFoundError("Could not find 'tessent' executable in path")
         return "tessent"
     elif str(specified_exe) != "tessent" and not Path(specified_exe).exists():
@@ -34,10 +70,75 @@ def get_tessent_exe(specified_exe: str | Path | None = None) -> str:
     return str(specified_exe)
 
 
+def run_dofile(
+    do_file: Path | str,
+    log_file: Path | str | None = None,
+    replace: bool = False,
+    arguments: dict[str, str] | None = None,
+    timeout: int | None = None,
+    tessent_exe: Path | str | None = None,
+) -> str:
+    """Run a TCL script in a batch Tessent process and return its output.
+
+    For run-and-exit scripts (the dofile must end with `exit`), this skips the
+    pty and prompt matching of an interactive `PyTessent` shell entirely and
+    just collects stdout from a plain subprocess.
+
+    Args:
+        do_file: path to TCL script to run in Tessent.
+        log_file: path to save Tessent log file to.
+        replace: replace existing log file if it already exists.
+        arguments: arguments passed to Tessent -shell using "-arguments" option.
+        timeout: timeout limit for the whole run. If `None`, no timeout.
+        tessent_exe: tessent executable to launch Tessent from. If `None`, queried
+            from the $PATH variable.
+
+    Raises:
+        TessentCommandError: raised if the Tessent process exits nonzero.
+
+    Returns:
+        everything the Tessent process printed to stdout.
+    """
+    import subprocess
+
+    command = [get_tessent_exe(specified_exe=tessent_exe), "-shell"]
+    command += ["-dofile", str(do_file)]
+    if log_file:
+        command += ["-logfile", str(log_file)]
+        if replace:
+            command.append("-replace")
+    if arguments:
+        command.append("-arguments")
+        for k, v in arguments.items():
+            command.append(f"{k}={v}")
+
+    result = subprocess.run(
+        command, capture_output=True, text=True, timeout=timeout
+    )
+    if result.returncode != 0:
+        raise TessentCommandError(
+            f"Dofile '{do_file}' failed with exit code {result.returncode}: "
+            f"{result.stderr}"
+        )
+    return result.stdout
+
+
 class PyTessent:
     """Class for interacting with a Tessent shell process."""
 
     _default_expect_patterns: list[str] = ["SETUP> ", "ANALYSIS> "]
+    # prompts only ever appear at the end of the buffer, so only search there
+    _search_window_size: int = 4096
+    # read up to 64 KiB per syscall; the pexpect default of 2000 bytes makes
+    # large report outputs arrive in dozens of tiny reads
+    _max_read: int = 65536
+    # the default prompts compiled once (as pexpect would: bytes, DOTALL) and
+    # shared across instances; folded into one alternation so each expect
+    # round makes a single pass over the search window instead of one per
+    # prompt pattern
+    _default_compiled_patterns: list[re.Pattern[bytes]] = [
+        re.compile(rb"(?:SETUP|ANALYSIS)> ", re.DOTALL)
+    ]
 
     def __init__(
         self,
@@ -65,31 +166,56 @@ class PyTessent:
             expect_patterns: patterns to expect from Tessent indicating it is ready for
                 input. If `None`, checks for "SETUP> " and "ANALYSIS> ".
         """
+        # deferred import: loading pexpect/ptyprocess is wasted startup cost
+        # for callers that never launch a shell (e.g. pickle-based analysis)
+        global pexpect
+        import pexpect
+
         self.timeout = timeout
         self._tessent_exe = get_tessent_exe(specified_exe=tessent_exe)
+        # bumped whenever shell-side report state changes (e.g. set_gate_report
+        # against a new pattern); Gate report caches compare against it to
+        # invalidate lazily
+        self._sim_generation: int = 0
+        # sequence for the per-command sentinel markers (see _wrap_command)
+        self._cmd_seq = count()
 
         if not expect_patterns:
             self._expect_patterns = self._default_expect_patterns
         else:
             self._expect_patterns = expect_patterns
 
-        launch_command_parts = [self.tessent_exe, "-shell"]
+        launch_args = ["-shell"]
         if do_file:
-            launch_command_parts.append(f"-dofile {do_file}")
+            launch_args += ["-dofile", os.fspath(do_file)]
         if log_file:
-            launch_command_parts.append(f"-logfile {log_file}")
+            launch_args += ["-logfile", os.fspath(log_file)]
             if replace:
-                launch_command_parts.append("-replace")
+                launch_args.append("-replace")
         if arguments:
-            launch_command_parts.append("-arguments")
+            launch_args.append("-arguments")
             for k, v in arguments.items():
-                launch_command_parts.append(f"{k}={v}")
-        launch_command = " ".join(launch_command_parts)
-
-        self._process = pexpect.spawn(launch_command)
-        self._cpl = self._process.compile_pattern_list(
-            self._expect_patterns  # type: ignore
+                launch_args.append(f"{k}={v}")
+
+        # note: the shell is deliberately spawned in bytes mode (no encoding=):
+        # the compiled prompt patterns are bytes, and send_command_bytes relies
+        # on raw buffers so large outputs can be cleaned without a str decode
+        #
+        # searchwindowsize bounds the prompt search to the tail of the buffer;
+        # without it pexpect rescans the entire accumulated output on every
+        # read, which is quadratic on commands that print a lot
+        self._process = pexpect.spawn(
+            self.tessent_exe,
+            launch_args,
+            maxread=self._max_read,
+            searchwindowsize=self._search_window_size,
         )
+        if self._expect_patterns is self._default_expect_patterns:
+            self._cpl = self._default_compiled_patterns
+        else:
+            self._cpl = self._process.compile_pattern_list(
+                self._expect_patterns  # type: ignore
+            )
         self._finalizer = weakref.finalize(self, self._close_process)
         self._expect()
 
@@ -127,20 +253,64 @@ class PyTessent:
             async_=async_,  # type: ignore
         )
 
-    def _clean_result(self, command: str, result: bytes | None) -> str:
+    def _wrap_command(self, command: str) -> tuple[str, str, str]:
+        """Bracket a command between unique sentinel markers.
+
+        The begin marker lands just after the echoed command and the end
+        marker just before the prompt, so the result can be sliced out with
+        two short marker searches instead of scanning the whole output for
+        the echoed command text. The command runs under `catch` with its
+        result (or error message) re-printed, so a failing command still
+        reaches the end marker and still reports its error text the way the
+        bare interactive shell would.
+        """
+        seq = next(self._cmd_seq)
+        begin = f"<pyt:{seq}>"
+        end = f"</pyt:{seq}>"
+        wrapped = (
+            f"puts {{{begin}}}; "
+            f"catch {{{command}}} pyt_result; puts $pyt_result; "
+            f"puts {{{end}}}"
+        )
+        return wrapped, begin, end
+
+    def _extract_result(
+        self, command: str, result: bytes | None, begin: str, end: str
+    ) -> bytes:
+        """Clean a raw reply and slice out the sentinel-bracketed result.
+
+        Everything happens at the bytes level — guarded carriage-return
+        delete, linear backspace pass, two bounded marker searches — so the
+        str-returning callers decode only the final result slice, never the
+        echo or prompt bytes around it.
+        """
         if result is None:
             raise TessentCommandError(f"No output returned from command '{command}'")
-        result_str = result.decode(_TESSENT_ENCODING)
-        # remove \r (leave \n)
-        result_str = result_str.replace("\r", "")
-        # remove weird backspace characters
-        result_str = re.sub(r".\x08", "", result_str)
-        # remove echoed command
-        if command not in result_str:
+        # remove \r (leave \n) and weird backspace characters; both steps
+        # skip the copy when there is nothing to remove
+        if b"\r" in result:
+            result = result.translate(None, delete=b"\r")
+        result = _strip_backspaces(result)
+        # slice between the sentinels; the begin marker sits near the start
+        # (right after the echo) and the end marker near the end, so neither
+        # search walks the bulk of a large output
+        begin_marker = begin.encode(_TESSENT_ENCODING) + b"\n"
+        end_marker = end.encode(_TESSENT_ENCODING)
+        begin_idx = result.find(begin_marker)
+        end_idx = result.rfind(end_marker)
+        if begin_idx == -1 or end_idx < begin_idx:
             raise TessentCommandError(
-                f"Command '{command}' not found in result '{result_str}'"
+                f"Output markers for command '{command}' not found in result "
+                f"'{result!r}'"
             )
-        return result_str.split(f"{command}\n", 1)[1].rstrip()
+        return result[begin_idx + len(begin_marker) : end_idx].rstrip()
+
+    def _clean_result(
+        self, command: str, result: bytes | None, begin: str, end: str
+    ) -> str:
+        return self._extract_result(command, result, begin, end).decode(
+            _TESSENT_ENCODING
+        )
 
     def send_command(self, command: str, timeout: int | None = None) -> str:
         """Send a command to tessent and get back the resulting message.
@@ -149,20 +319,76 @@ class PyTessent:
             command: command to send to active tessent shell.
 
         Raises:
-            TessentCommandError: raised if the command was not found echoed in the
-                resulting output.
+            TessentCommandError: raised if the command's output markers were not
+                found in the resulting output.
 
         Returns:
             resulting message printed to shell after running command.
         """
-        self.process.sendline(command)
+        wrapped, begin, end = self._wrap_command(command)
+        self.process.sendline(wrapped)
         self._expect(timeout)
-        return self._clean_result(command, self.process.before)
+        return self._clean_result(command, self.process.before, begin, end)
+
+    def send_command_bytes(self, command: str, timeout: int | None = None) -> bytes:
+        """Send a command to tessent and get back the resulting message as `bytes`.
+
+        Like `send_command`, but all cleanup happens at the bytes level and no
+        decode is performed — preferable for very large query outputs where the
+        caller tokenizes the result itself.
+
+        Args:
+            command: command to send to active tessent shell.
+
+        Raises:
+            TessentCommandError: raised if the command's output markers were not
+                found in the resulting output.
+
+        Returns:
+            resulting message printed to shell after running command, undecoded.
+        """
+        wrapped, begin, end = self._wrap_command(command)
+        self.process.sendline(wrapped)
+        self._expect(timeout)
+        return self._extract_result(command, self.process.before, begin, end)
+
+    def send_commands(
+        self, commands: list[str], timeout: int | None = None
+    ) -> list[str]:
+        """Send a list of commands to tessent, then collect each resulting message.
+
+        All commands are written to the shell up front and their results read back
+        in order, so the prompt wait is paid once per batch rather than once per
+        command. Commands must be non-interactive.
+
+        Args:
+            commands: commands to send to active tessent shell.
+            timeout: timeout limit applied to each command result.
+
+        Raises:
+            TessentCommandError: raised if a command's output markers were not
+                found in its resulting output.
+
+        Returns:
+            resulting messages, one per command, in command order.
+        """
+        wrapped_commands = [self._wrap_command(command) for command in commands]
+        for wrapped, _, _ in wrapped_commands:
+            self.process.sendline(wrapped)
+
+        results = []
+        for command, (_, begin, end) in zip(commands, wrapped_commands):
+            self._expect(timeout)
+            results.append(
+                self._clean_result(command, self.process.before, begin, end)
+            )
+        return results
 
     async def send_command_async(self, command: str, timeout: int | None = None):
-        self.process.sendline(command)
+        wrapped, begin, end = self._wrap_command(command)
+        self.process.sendline(wrapped)
         await self._expect(timeout, async_=True)
-        return self._clean_result(command, self.process.before)
+        return self._clean_result(command, self.process.before, begin, end)
 
     def _close_process(self) -> None:
         """Close the open tessent shell process.
@@ -170,9 +396,13 @@ class PyTessent:
         Should only be used by `weakref.finalize` in the intializer.
         """
         try:
-            self.send_command("exit -force")
-        # ignore pexpect exception
-        except pexpect.exceptions.EOF:
+            # fire-and-forget: exiting never returns a prompt, so don't wait
+            # on the expect loop for one; skip the write entirely if the
+            # shell has already exited on its own
+            if self.process.isalive():
+                self.process.sendline("exit -force")
+        # ignore pexpect exception and already-closed pty errors
+        except (pexpect.exceptions.EOF, OSError):
             pass
         self.process.close(force=True)
 
@@ -189,3 +419,57 @@ class PyTessent:
 
     def __exit__(self, *args, **kwargs):
         self.close()
+
+
+class PyTessentPool:
+    """Pool of warm Tessent shells for dispatching independent commands.
+
+    Launching `tessent -shell` takes seconds, so one-shell-per-command does
+    not scale. The pool pays the startup cost once for `size` shells and then
+    hands each `run` call the next idle shell, letting an asyncio caller keep
+    several slow commands in flight at once via `send_command_async`.
+
+    All pooled shells are launched with the same options, so `run` is only
+    appropriate for commands that do not depend on shell-local state set by a
+    previous command. Can be used as a context manager to close the shells on
+    exit.
+    """
+
+    def __init__(self, size: int, **shell_kwargs) -> None:
+        """Launch `size` Tessent shells, forwarding `shell_kwargs` to each.
+
+        Args:
+            size: number of shells to keep warm.
+            shell_kwargs: keyword arguments passed through to `PyTessent`
+                (do_file, timeout, tessent_exe, ...).
+        """
+        import asyncio
+
+        self._shells = [PyTessent(**shell_kwargs) for _ in range(size)]
+        self._idle: asyncio.Queue[PyTessent] = asyncio.Queue()
+        for pt in self._shells:
+            self._idle.put_nowait(pt)
+
+    @property
+    def size(self) -> int:
+        """Number of shells in the pool."""
+        return len(self._shells)
+
+    async def run(self, command: str, timeout: int | None = None) -> str:
+        """Run a command on the next idle shell, waiting for one if needed."""
+        pt = await self._idle.get()
+        try:
+            return await pt.send_command_async(command, timeout)
+        finally:
+            self._idle.put_nowait(pt)
+
+    def close(self) -> None:
+        """Close all pooled shells."""
+        for pt in self._shells:
+            pt.close()
+
+    def __enter__(self) -> "PyTessentPool":
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()